@@ -5,3 +5,4 @@ from .response import Response, ResponseType, ResponseFlags
 from .objects import Embed
 from .components import SelectValue, ButtonStyle, InvokeContext
 from .deferred import CommandsBlueprint
+from .runtime import install_uvloop
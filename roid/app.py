@@ -1,51 +1,87 @@
+import os
 import re
+import asyncio
+import sys
+import binascii
 import logging
-import uuid
-import inspect
+import secrets
 import typing
+import functools
 
-try:
-    orjson_enabled = True
-    import orjson as json
-except ImportError:
-    orjson_enabled = False
-    import json
+import orjson
 
 from enum import Enum
-from typing import Dict, Type, Callable, Optional, List, Union, Literal
-from nacl.signing import VerifyKey
-from nacl.exceptions import BadSignatureError
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Dict,
+    Type,
+    Callable,
+    Optional,
+    List,
+    Union,
+    Literal,
+    Set,
+    Any,
+    Coroutine,
+    Tuple,
+)
 from fastapi import FastAPI, Request
 from fastapi.exceptions import HTTPException
-from fastapi.responses import JSONResponse, ORJSONResponse
-from pydantic import ValidationError, validate_arguments, constr, conint
+from fastapi.responses import ORJSONResponse, Response as RawResponse
+from pydantic import ValidationError
 
 from roid.components import (
     Component,
     ComponentType,
     ButtonStyle,
-    EMOJI_REGEX,
     SelectOption,
     SelectValue,
     InvokeContext,
+    parse_emoji,
+    validate_custom_id,
 )
 from roid.exceptions import CommandAlreadyExists, ComponentAlreadyExists
-from roid.objects import PartialEmoji
+from roid.objects import Member, User, PartialMessage
 from roid.command import CommandType, Command, CommandGroup
-from roid.interactions import InteractionType, Interaction
+from roid.interactions import (
+    InteractionType,
+    Interaction,
+    InteractionData,
+)
 from roid.error_handlers import KNOWN_ERRORS
 from roid.response import (
     ResponsePayload,
     ResponseType,
     ResponseData,
+    ResponseFlags,
     Response,
 )
 from roid.http import HttpHandler
 from roid.state import StorageBackend, MultiManagedState, SqliteBackend
+from roid.verify import SignatureVerifier, BatchVerifier
 from roid.deferred import CommandsBlueprint, DeferredGroupCommand
 
 _log = logging.getLogger("roid-main")
 
+# Discord pings regularly, the reply never changes.
+_PONG_BODY = b'{"type":%d}' % ResponseType.PONG
+
+# Plain ints so the raw payload's type is compared without the enum.
+_PING = InteractionType.PING.value
+_AUTOCOMPLETE = InteractionType.APPLICATION_COMMAND_AUTOCOMPLETE.value
+
+# Bodies for requests rejected before reaching a handler, these match what
+# FastAPI renders for the equivalent HTTPException.
+_UNAUTHORIZED_BODY = orjson.dumps({"detail": "Unauthorized"})
+_BAD_REQUEST_BODY = orjson.dumps({"detail": "Bad Request"})
+_INVALID_JSON_BODY = orjson.dumps({"detail": "Invalid JSON payload"})
+_INVALID_PAYLOAD_BODY = orjson.dumps({"detail": "Invalid interaction payload"})
+_NO_COMMAND_BODY = orjson.dumps({"detail": "No command found"})
+_NO_COMPONENT_BODY = orjson.dumps({"detail": "No component found"})
+
+_GROUP_NAME = re.compile("[a-zA-Z0-9]+")
+_GROUP_DESCRIPTION = re.compile("[a-zA-Z0-9 ]+")
+
 
 class SlashCommands(FastAPI):
     """
@@ -63,6 +99,11 @@ class SlashCommands(FastAPI):
         token: str,
         register_commands: bool = False,
         state_backend: Optional[StorageBackend] = None,
+        max_concurrent_interactions: Optional[int] = None,
+        ack_budget: Optional[float] = None,
+        sync_workers: Optional[int] = None,
+        offload_verification: bool = False,
+        verify_cache_size: int = 0,
         **extra,
     ):
         """
@@ -94,19 +135,62 @@ class SlashCommands(FastAPI):
                 WARNING: If this is True it will bulk overwrite the existing
                 application global commands and guild commands.
 
+                Registration runs in the background once the server has started,
+                use `register_commands_on_start(wait=True)` to block startup on it.
+
             state_backend:
                 The given storage backend to use for internal state management
                 and `SlashCommands.state` calls.
 
                 If no backend is given the Sqlite backend is used.
+
+            max_concurrent_interactions:
+                The maximum number of interaction handlers that can be running
+                at once, any further interactions wait for a handler to finish.
+
+                Interactions must be answered within 3 seconds so any limit
+                should leave enough room for a burst of interactions.
+
+                Defaults to None (no limit).
+
+            ack_budget:
+                The number of seconds a command has to respond before the
+                interaction is deferred, the command's response then replaces
+                the deferred message once it completes.
+
+                Discord drops any interaction not responded to within 3 seconds,
+                so a value such as `2.5` keeps slow commands alive. Ephemeral
+                responses are sent as a new ephemeral followup as the deferred
+                message itself is always public.
+
+                Defaults to None (commands are never deferred).
+
+            sync_workers:
+                The number of threads used to run non-async commands, components
+                and checks.
+
+                Defaults to the number of CPUs plus 4, up to 32.
+
+            offload_verification:
+                If True request signatures are verified on a pool of threads
+                rather than on the event loop, requests arriving together are
+                verified as a batch. This helps under heavy load on multi-core
+                machines but adds overhead for small deployments.
+
+                Defaults to False.
+
+            verify_cache_size:
+                The number of verified requests to remember for a minute so
+                duplicate deliveries skip signature verification.
+
+                Defaults to 0 (disabled).
         """
 
-        response_class = ORJSONResponse if orjson_enabled else JSONResponse
         super().__init__(
             **extra,
             docs_url=None,
             redoc_url=None,
-            default_response_class=response_class,
+            default_response_class=ORJSONResponse,
         )
 
         if state_backend is None:
@@ -116,22 +200,61 @@ class SlashCommands(FastAPI):
         self.__state: Optional[MultiManagedState] = None
 
         self.register_commands = register_commands
-        self._verify_key = VerifyKey(bytes.fromhex(application_public_key))
+        self._wait_for_registration = False
+        self._register_task: Optional[asyncio.Task] = None
+        self._verifier = SignatureVerifier(
+            application_public_key, cache_size=verify_cache_size
+        )
         self._application_id = application_id
         self._token = token
-        self._global_error_handlers = KNOWN_ERRORS
+        self._global_error_handlers = dict(KNOWN_ERRORS)
+        self._error_handler_cache: Dict[Type[Exception], Optional[Callable]] = {}
 
         self._commands: Dict[str, Union[Command, CommandGroup]] = {}
         self._components: Dict[str, Component] = {}
         self._http: Optional[HttpHandler] = None
 
+        self._max_concurrent_interactions = max_concurrent_interactions
+        self._dispatch_limit: Optional[asyncio.Semaphore] = None
+
+        self._ack_budget = ack_budget
+        self._deferred_tasks: Set[asyncio.Task] = set()
+
+        # The pools are created on startup as they are shut down with the app.
+        self._sync_workers = sync_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._sync_pool: Optional[ThreadPoolExecutor] = None
+
+        self._offload_verification = offload_verification
+        self._verify_pool: Optional[ThreadPoolExecutor] = None
+        self._batch_verifier: Optional[BatchVerifier] = None
+
+        # Interaction types mapped to their handlers, pings are answered
+        # before dispatching so they have no entry here.
+        self._dispatch = {
+            InteractionType.APPLICATION_COMMAND.value: self._handle_command,
+            InteractionType.APPLICATION_COMMAND_AUTOCOMPLETE.value: self._handle_command,
+            InteractionType.MESSAGE_COMPONENT.value: self._handle_component,
+        }
+
         # register the internal route and FastAPI internals.
         self.post("/", name="Interaction Events")(self.__root)
         self.on_event("startup")(self._startup)
         self.on_event("shutdown")(self._shutdown)
 
-    def register_commands_on_start(self):
+    def register_commands_on_start(self, wait: bool = False):
+        """
+        Registers all commands with Discord when the server starts.
+
+        Args:
+            wait:
+                If True the server waits for registration to complete before
+                accepting interactions, otherwise it runs in the background.
+
+                Defaults to False.
+        """
+
         self.register_commands = True
+        self._wait_for_registration = wait
 
     @property
     def state(self) -> MultiManagedState:
@@ -151,6 +274,22 @@ class SlashCommands(FastAPI):
         """A startup lifetime task invoked by the ASGI server."""
 
         self._http = HttpHandler(self.application_id, self._token)
+        if self._max_concurrent_interactions is not None:
+            self._dispatch_limit = asyncio.Semaphore(self._max_concurrent_interactions)
+        self._sync_pool = ThreadPoolExecutor(
+            max_workers=self._sync_workers,
+            thread_name_prefix="roid-sync",
+        )
+
+        if self._offload_verification:
+            workers = os.cpu_count() or 2
+            self._verify_pool = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="roid-verify",
+            )
+            self._batch_verifier = BatchVerifier(
+                self._verifier, self._verify_pool, workers
+            )
 
         self.__state = MultiManagedState(backend=self.__state_backend)
         await self.__state.startup()
@@ -158,24 +297,64 @@ class SlashCommands(FastAPI):
         if not self.register_commands:
             return
 
+        # Registration is a handful of rate limited requests to Discord,
+        # so unless asked to wait it runs in the background while we serve.
+        if self._wait_for_registration:
+            await self._register_all_commands()
+        else:
+            self._register_task = asyncio.create_task(self._register_all_commands())
+            self._register_task.add_done_callback(_log_registration_failure)
+
+    async def _register_all_commands(self):
         # We can set the globals in bulk.
         await self.reload_global_commands()
 
+        # Each guild's commands are also overwritten in bulk.
+        guilds: Dict[int, List[Command]] = {}
         for command in self._commands.values():
-            if command.guild_ids is None:
-                continue
+            for guild_id in command.guild_ids or ():
+                guilds.setdefault(guild_id, []).append(command)
 
+        for guild_id, commands in guilds.items():
             _log.info(
-                f"Registering command {command.name} for guilds: {command.guild_ids}"
+                "Registering commands %s for guild: %s",
+                [c.name for c in commands],
+                guild_id,
             )
-            await command.register(self)
+
+        # One guild failing (e.g. the bot was removed) shouldn't stop the rest.
+        results = await asyncio.gather(
+            *(
+                self._http.register_guild_commands(guild_id, commands)
+                for guild_id, commands in guilds.items()
+            ),
+            return_exceptions=True,
+        )
+
+        for guild_id, result in zip(guilds, results):
+            if isinstance(result, Exception):
+                _log.error(
+                    "failed to register commands for guild: %s",
+                    guild_id,
+                    exc_info=result,
+                )
 
     async def _shutdown(self):
         """A shutdown lifetime task invoked by the ASGI server."""
 
+        if self._register_task is not None and not self._register_task.done():
+            self._register_task.cancel()
+
+        # Let any deferred responses finish sending before the client closes.
+        if self._deferred_tasks:
+            await asyncio.gather(*self._deferred_tasks, return_exceptions=True)
+
         try:
             await self._http.shutdown()
         finally:
+            self._sync_pool.shutdown(wait=False)
+            if self._verify_pool is not None:
+                self._verify_pool.shutdown(wait=False)
             await self.__state.shutdown()
 
     async def reload_global_commands(self):
@@ -200,6 +379,8 @@ class SlashCommands(FastAPI):
 
         This means that if an error is raised by the system that matches the given
         exception type the callback will be invoked and it's response sent back.
+        Subclasses of the type are matched too, the handler registered for the
+        closest type in the error's MRO is used.
 
         The traceback is not logged if this is set.
 
@@ -214,60 +395,171 @@ class SlashCommands(FastAPI):
             raise TypeError("error type does not inherit from `Exception`")
 
         self._global_error_handlers[error] = callback
+        self._error_handler_cache.clear()
 
-    async def __root(self, request: Request):
+    def _get_error_handler(self, error: Type[Exception]) -> Optional[Callable]:
         try:
-            signature = request.headers["X-Signature-Ed25519"]
-            timestamp = request.headers["X-Signature-Timestamp"]
+            return self._error_handler_cache[error]
+        except KeyError:
+            pass
+
+        handler = None
+        for cls in error.__mro__:
+            handler = self._global_error_handlers.get(cls)
+            if handler is not None:
+                break
 
-            body = await request.body()
+        self._error_handler_cache[error] = handler
+        return handler
 
-            self._verify_key.verify(
-                b"%s%s" % (timestamp.encode(), body), bytes.fromhex(signature)
-            )
-        except (BadSignatureError, KeyError):
-            raise HTTPException(status_code=401)
+    async def __root(self, request: Request):
+        signature, timestamp = _signature_headers(request.headers.raw)
+        if not signature or not timestamp:
+            return _reject(401, _UNAUTHORIZED_BODY)
 
-        data = json.loads(body)
-        logging.debug(f"got payload: {data}")
+        try:
+            signature = binascii.unhexlify(signature)
+        except ValueError:
+            return _reject(401, _UNAUTHORIZED_BODY)
+
+        # The signed message is the timestamp followed by the body, reading
+        # the body straight into the same buffer avoids a second copy.
+        message = bytearray(timestamp)
+        async for chunk in request.stream():
+            message += chunk
+        body = memoryview(message)[len(timestamp) :]
+
+        if self._batch_verifier is None:
+            valid = self._verifier.verify(signature, message)
+        else:
+            valid = await self._batch_verifier.verify(signature, message)
+
+        if not valid:
+            return _reject(401, _UNAUTHORIZED_BODY)
+
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("got payload: %s", bytes(body))
 
+        # Interactions are routed on the raw payload, the full interaction
+        # is only validated once we know there is something to invoke.
         try:
-            interaction = Interaction(**data)
-        except ValidationError as e:
-            _log.warning(f"rejecting response due to {e!r}")
-            raise HTTPException(status_code=422, detail=e.errors())
-
-        if interaction.type == InteractionType.PING:
-            return {"type": ResponseType.PONG}
-        elif interaction.type in (
-            InteractionType.APPLICATION_COMMAND,
-            InteractionType.APPLICATION_COMMAND_AUTOCOMPLETE,
-        ):
-            cmd = self._commands.get(interaction.data.name)
-            if cmd is None:
-                raise HTTPException(status_code=400, detail="No command found")
+            data = orjson.loads(body)
+        except ValueError:
+            return _reject(422, _INVALID_JSON_BODY)
 
-            DEFAULT_RESPONSE_TYPE = ResponseType.CHANNEL_MESSAGE_WITH_SOURCE
-            return await self._invoke_with_handlers(
-                cmd, interaction, DEFAULT_RESPONSE_TYPE, pass_parent=True
-            )
+        if type(data) is not dict:
+            return _reject(422, _INVALID_PAYLOAD_BODY)
 
-        elif interaction.type == InteractionType.MESSAGE_COMPONENT:
-            if interaction.data.custom_id is None:
-                raise HTTPException(status_code=400)
+        interaction_type = data.get("type")
 
-            custom_id, *_ = interaction.data.custom_id.split(":", maxsplit=1)
+        # Pings carry nothing else we need, so they skip validation entirely.
+        if interaction_type == _PING:
+            return RawResponse(_PONG_BODY, media_type="application/json")
 
-            component = self._components.get(custom_id)
-            if component is None:
-                raise HTTPException(status_code=400, detail="No component found")
+        handler = None
+        if type(interaction_type) is int:
+            handler = self._dispatch.get(interaction_type)
 
-            DEFAULT_RESPONSE_TYPE = ResponseType.UPDATE_MESSAGE
-            return await self._invoke_with_handlers(
-                component, interaction, DEFAULT_RESPONSE_TYPE
-            )
+        if handler is None:
+            return _reject(400, _BAD_REQUEST_BODY)
+
+        inner = data.get("data")
+        if type(inner) is not dict:
+            return _reject(400, _BAD_REQUEST_BODY)
+
+        return await handler(data, inner)
+
+    async def _handle_command(self, data: dict, inner: dict):
+        name = inner.get("name")
+        if type(name) is not str:
+            return _reject(400, _BAD_REQUEST_BODY)
+
+        cmd = self._commands.get(name)
+        if cmd is None:
+            return _reject(400, _NO_COMMAND_BODY)
+
+        interaction = _parse_interaction(data)
+
+        DEFAULT_RESPONSE_TYPE = ResponseType.CHANNEL_MESSAGE_WITH_SOURCE
+        invoke = self._invoke_with_handlers(
+            cmd, interaction, DEFAULT_RESPONSE_TYPE, pass_parent=True
+        )
+
+        # Autocomplete interactions cannot be deferred.
+        if self._ack_budget is None or data["type"] == _AUTOCOMPLETE:
+            return _render(await invoke)
 
-        raise HTTPException(status_code=400)
+        return _render(await self._invoke_within_budget(interaction, invoke))
+
+    async def _handle_component(self, data: dict, inner: dict):
+        custom_id = inner.get("custom_id")
+        if type(custom_id) is not str:
+            return _reject(400, _BAD_REQUEST_BODY)
+
+        # Components with context are sent as `custom_id:reference_id`.
+        split_at = custom_id.find(":")
+        if split_at != -1:
+            custom_id = custom_id[:split_at]
+
+        component = self._components.get(custom_id)
+        if component is None:
+            return _reject(400, _NO_COMPONENT_BODY)
+
+        interaction = _parse_interaction(data)
+
+        DEFAULT_RESPONSE_TYPE = ResponseType.UPDATE_MESSAGE
+        resp = await self._invoke_with_handlers(
+            component, interaction, DEFAULT_RESPONSE_TYPE
+        )
+        return _render(resp)
+
+    async def _invoke_within_budget(
+        self,
+        interaction: Interaction,
+        invoke: Coroutine[Any, Any, ResponsePayload],
+    ) -> ResponsePayload:
+        task = asyncio.ensure_future(invoke)
+        done, _ = await asyncio.wait((task,), timeout=self._ack_budget)
+        if done:
+            return task.result()
+
+        _log.debug(
+            "interaction %s exceeded the ack budget, deferring response", interaction.id
+        )
+
+        followup = asyncio.create_task(self._complete_deferred(interaction, task))
+        self._deferred_tasks.add(followup)
+        followup.add_done_callback(self._deferred_tasks.discard)
+
+        return ResponsePayload(type=ResponseType.DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE)
+
+    async def _complete_deferred(
+        self,
+        interaction: Interaction,
+        task: "asyncio.Future[ResponsePayload]",
+    ):
+        try:
+            resp = await task
+        except Exception:
+            _log.exception("deferred interaction %s failed", interaction.id)
+            resp = None
+
+        try:
+            data = resp.data if resp is not None else None
+            if data is None:
+                # Don't leave the user with a loading message that never resolves.
+                await self._http.delete_interaction_message(interaction.token)
+            elif (data.flags or 0) & ResponseFlags.EPHEMERAL:
+                # The deferred message was sent publicly and editing it
+                # can't change that, so the reply is sent as a followup.
+                await self._http.delete_interaction_message(interaction.token)
+                await self._http.create_followup_message(interaction.token, data.dict())
+            else:
+                await self._http.edit_interaction_message(
+                    interaction.token, data.dict()
+                )
+        except Exception:
+            _log.exception("failed to complete deferred interaction %s", interaction.id)
 
     async def _invoke_with_handlers(
         self,
@@ -277,9 +569,13 @@ class SlashCommands(FastAPI):
         pass_parent: bool = False,
     ) -> ResponsePayload:
         try:
-            resp = await callback(self, interaction)
+            if self._dispatch_limit is None:
+                resp = await callback(self, interaction)
+            else:
+                async with self._dispatch_limit:
+                    resp = await callback(self, interaction)
         except Exception as e:
-            handler = self._global_error_handlers.get(type(e))
+            handler = self._get_error_handler(type(e))
             if handler is None:
                 raise e from None
             resp = handler(e)
@@ -292,7 +588,6 @@ class SlashCommands(FastAPI):
         _log.debug("returning response: %s", resp)
         return resp
 
-    @validate_arguments(config={"arbitrary_types_allowed": True})
     async def process_response(
         self,
         default_response_type: ResponseType,
@@ -326,23 +621,19 @@ class SlashCommands(FastAPI):
             resolved.
         """
         if response is None:
-            return await Response().into_response_payload(
-                app=self,
-                default_type=default_response_type,
-                parent_interaction=parent_interaction,
-            )
-
-        if isinstance(response, ResponsePayload):
-            return response
+            response = Response()
 
+        # Checked in order of how commonly each type is returned.
         if isinstance(response, Response):
             return await response.into_response_payload(
                 app=self,
                 default_type=default_response_type,
                 parent_interaction=parent_interaction,
             )
+        elif isinstance(response, ResponsePayload):
+            return response
         elif isinstance(response, ResponseData):
-            return ResponsePayload(type=default_response_type, data=response)
+            return ResponsePayload.construct(type=default_response_type, data=response)
 
         raise TypeError(
             f"expected either: {ResponsePayload!r}, "
@@ -363,7 +654,6 @@ class SlashCommands(FastAPI):
         for component in bp._components:  # noqa
             component(app=self)
 
-    @validate_arguments(config={"arbitrary_types_allowed": True})
     def group(
         self,
         name: str,
@@ -373,12 +663,8 @@ class SlashCommands(FastAPI):
         guild_ids: List[int] = None,
         default_permissions: bool = True,
         defer_register: bool = False,
-        group_name: constr(
-            strip_whitespace=True, regex="[a-zA-Z0-9]+", min_length=1, max_length=30
-        ) = "command",
-        group_description: constr(
-            strip_whitespace=True, regex="[a-zA-Z0-9 ]+", min_length=1, max_length=95
-        ) = "Select a sub command to run.",
+        group_name: str = "command",
+        group_description: str = "Select a sub command to run.",
         existing_commands: Dict[str, DeferredGroupCommand] = None,  # noqa
     ):
         """
@@ -418,6 +704,25 @@ class SlashCommands(FastAPI):
                 The description of the select option for the sub commands.
         """
 
+        group_name = group_name.strip()
+        if not 0 < len(group_name) <= 30 or not _GROUP_NAME.match(group_name):
+            raise ValueError(
+                f"group_name must be 1 to 30 alphanumeric characters, "
+                f"got {group_name!r}."
+            )
+
+        group_description = group_description.strip()
+        if not 0 < len(group_description) <= 95 or not _GROUP_DESCRIPTION.match(
+            group_description
+        ):
+            raise ValueError(
+                f"group_description must be 1 to 95 alphanumeric characters "
+                f"or spaces, got {group_description!r}."
+            )
+
+        # Interned as it's kept as a dispatch key for the app's lifetime.
+        name = sys.intern(name)
+
         cmd = CommandGroup(
             app=self,
             name=name,
@@ -440,7 +745,6 @@ class SlashCommands(FastAPI):
 
         return cmd
 
-    @validate_arguments
     def command(
         self,
         name: str,
@@ -491,13 +795,17 @@ class SlashCommands(FastAPI):
 
                 If set to `False` this will not be automatically registered / updated.
         """
+        # Decorator arguments are checked directly rather than validated.
+        type = CommandType(type)  # noqa
         if type in (CommandType.MESSAGE, CommandType.USER) and description is not None:
             raise ValueError(f"only CHAT_INPUT types can have a set description.")
-        elif type is CommandType.CHAT_INPUT and description is None:
+        elif type == CommandType.CHAT_INPUT and description is None:
             raise ValueError(
                 f"missing required field 'description' for CHAT_INPUT commands."
             )
 
+        name = sys.intern(name)
+
         def wrapper(func):
             cmd = Command(
                 app=self,
@@ -522,19 +830,14 @@ class SlashCommands(FastAPI):
 
         return wrapper
 
-    @validate_arguments
     def button(
         self,
         label: str,
         style: ButtonStyle,
         *,
-        custom_id: Optional[
-            constr(
-                strip_whitespace=True, regex="[a-zA-Z0-9]+", min_length=1, max_length=32
-            )
-        ] = None,
+        custom_id: Optional[str] = None,
         disabled: bool = False,
-        emoji: constr(strip_whitespace=True, regex=EMOJI_REGEX) = None,
+        emoji: Optional[str] = None,
         url: Optional[str] = None,
         oneshot: bool = False,
     ):
@@ -572,13 +875,17 @@ class SlashCommands(FastAPI):
                 create one shot buttons which are invalidated after the first use.
         """
 
+        style = ButtonStyle(style)
+
         if emoji is not None:
-            emoji = re.findall(EMOJI_REGEX, emoji)[0]
-            animated, name, id_ = emoji
-            emoji = PartialEmoji(id=id_, name=name, animated=bool(animated))
+            emoji = parse_emoji(emoji)
 
         if custom_id is None:
-            custom_id = str(uuid.uuid4())
+            custom_id = secrets.token_urlsafe(12)
+        else:
+            custom_id = validate_custom_id(custom_id)
+
+        custom_id = sys.intern(custom_id)
 
         if url is not None:
             custom_id = None
@@ -609,19 +916,14 @@ class SlashCommands(FastAPI):
 
         return wrapper
 
-    @validate_arguments
     def select(
         self,
         *,
-        custom_id: Optional[
-            constr(
-                strip_whitespace=True, regex="[a-zA-Z0-9]+", min_length=1, max_length=32
-            )
-        ] = None,
+        custom_id: Optional[str] = None,
         disabled: bool = False,
         placeholder: str = "Select an option.",
-        min_values: conint(ge=0, le=25) = 1,
-        max_values: conint(ge=0, le=25) = 1,
+        min_values: int = 1,
+        max_values: int = 1,
         oneshot: bool = False,
     ):
         """
@@ -655,7 +957,14 @@ class SlashCommands(FastAPI):
         """
 
         if custom_id is None:
-            custom_id = str(uuid.uuid4())
+            custom_id = secrets.token_urlsafe(12)
+        else:
+            custom_id = validate_custom_id(custom_id)
+
+        custom_id = sys.intern(custom_id)
+
+        if not 0 <= min_values <= 25 or not 0 <= max_values <= 25:
+            raise ValueError(f"select min_values and max_values must be within 0-25.")
 
         if max_values < min_values:
             raise ValueError(
@@ -664,13 +973,12 @@ class SlashCommands(FastAPI):
             )
 
         def wrapper(func):
-            spec = inspect.getfullargspec(func)
-
-            for param, hint in spec.annotations.items():
+            for param, hint in func.__annotations__.items():
                 if hint in (Interaction, InvokeContext):
                     continue
 
                 origin = typing.get_origin(hint)
+                args = typing.get_args(hint)
 
                 # Needed if it's a multi-valued select.
                 if origin is not list and max_values != 1 and min_values != 1:
@@ -679,7 +987,7 @@ class SlashCommands(FastAPI):
                     )
 
                 if origin is list:
-                    inner, *_ = typing.get_args(origin)
+                    inner, *_ = args
                     if inner is str:
                         options = []
                         break
@@ -688,9 +996,7 @@ class SlashCommands(FastAPI):
                     options = []
                     break
 
-                options = _get_select_options(
-                    typing.get_args(hint)[0] if origin is list else hint
-                )
+                options = _get_select_options(args[0] if origin is list else hint)
                 if len(options) == 0:
                     raise ValueError(f"Select options must contain at least one value.")
 
@@ -725,8 +1031,84 @@ class SlashCommands(FastAPI):
         return wrapper
 
 
+def _log_registration_failure(task: asyncio.Task):
+    if task.cancelled():
+        return
+
+    exc = task.exception()
+    if exc is not None:
+        _log.error("failed to register commands with discord", exc_info=exc)
+
+
+def _signature_headers(
+    raw: List[Tuple[bytes, bytes]],
+) -> Tuple[Optional[bytes], Optional[bytes]]:
+    # ASGI header names are always lower case so the raw headers can be
+    # scanned once without building the case-insensitive mapping.
+    signature = timestamp = None
+    for key, value in raw:
+        if key == b"x-signature-ed25519":
+            signature = value
+        elif key == b"x-signature-timestamp":
+            timestamp = value
+
+    return signature, timestamp
+
+
+def _reject(status_code: int, body: bytes) -> RawResponse:
+    return RawResponse(body, status_code=status_code, media_type="application/json")
+
+
+def _render(payload: ResponsePayload) -> ORJSONResponse:
+    # Skips FastAPI's jsonable_encoder pass over the returned model.
+    return ORJSONResponse(payload.dict())
+
+
+def _parse_interaction(data: dict) -> Interaction:
+    # The signature has already proven the payload came from Discord, so the
+    # flat top level fields are trusted and only the nested objects handlers
+    # work with are validated.
+    try:
+        return Interaction.construct(
+            id=int(data["id"]),
+            application_id=int(data["application_id"]),
+            type=InteractionType(data["type"]),
+            data=_parse_optional(InteractionData, data.get("data")),
+            guild_id=_parse_optional(int, data.get("guild_id")),
+            channel_id=_parse_optional(int, data.get("channel_id")),
+            member=_parse_optional(Member, data.get("member")),
+            user=_parse_optional(User, data.get("user")),
+            token=data["token"],
+            version=data["version"],
+            message=_parse_optional(PartialMessage, data.get("message")),
+        )
+    except ValidationError as e:
+        _log.warning("rejecting response due to %r", e)
+        raise HTTPException(status_code=422, detail=e.errors())
+    except (KeyError, TypeError, ValueError) as e:
+        _log.warning("rejecting response due to %r", e)
+        raise HTTPException(status_code=422, detail="Invalid interaction payload")
+
+
+def _parse_optional(type_, value):
+    if value is None:
+        return None
+
+    if type_ is int:
+        return int(value)
+
+    return type_.parse_obj(value)
+
+
 def _get_select_options(val: typing.Any) -> List[SelectOption]:
+    # Copied so a component can't mutate the cached options of another.
+    return list(_build_select_options(val))
+
+
+@functools.lru_cache(maxsize=None)
+def _build_select_options(val: typing.Any) -> Tuple[SelectOption, ...]:
     option_choices = []
+    seen_labels = set()
     if typing.get_origin(val) is Literal:
         for value in typing.get_args(val):
             if not isinstance(value, str):
@@ -741,11 +1123,12 @@ def _get_select_options(val: typing.Any) -> List[SelectOption]:
                 value=value,
             )
 
-            if option in option_choices:
+            if option.label in seen_labels:
                 raise ValueError(f"select options cannot have duplicate labels.")
+            seen_labels.add(option.label)
 
             option_choices.append(option)
-        return option_choices
+        return tuple(option_choices)
 
     if not issubclass(val, Enum):
         raise TypeError(
@@ -754,8 +1137,12 @@ def _get_select_options(val: typing.Any) -> List[SelectOption]:
             "This means you can add options at runtime via component.with_options()."
         )
 
-    set_type = None
-    for v in val:
+    members = list(val)
+    if not members:
+        return ()
+
+    set_type = type(members[0].value)
+    for v in members:
         if not isinstance(v.value, (str, SelectValue)):
             raise TypeError(
                 f"select options have incompatible types. "
@@ -763,13 +1150,11 @@ def _get_select_options(val: typing.Any) -> List[SelectOption]:
                 f"Found {type(v.value)!r}"
             )
 
-        if (set_type is not None) and (type(v.value) is not set_type):
+        if type(v.value) is not set_type:
             raise TypeError(
                 f"enum values must all be the same type. "
                 f"Expected type: {set_type!r} got {type(v.value)!r}"
             )
-        else:
-            set_type = type(v.value)
 
         if isinstance(v.value, SelectValue):
             value = v.value
@@ -786,8 +1171,9 @@ def _get_select_options(val: typing.Any) -> List[SelectOption]:
                 value=v.value,
             )
 
-        if option in option_choices:
+        if option.label in seen_labels:
             raise ValueError(f"select options cannot have duplicate labels.")
+        seen_labels.add(option.label)
 
         option_choices.append(option)
-    return option_choices
+    return tuple(option_choices)
@@ -14,6 +14,25 @@ if TYPE_CHECKING:
 
 
 class OptionalAsyncCallable:
+    # Subclasses keep a `__dict__` for their own state, the attributes read on
+    # every invocation live in slots.
+    __slots__ = (
+        "_callback",
+        "_callback_is_coro",
+        "_invoke",
+        "_on_error",
+        "_on_error_is_coro",
+        "_pass_error_app",
+        "_pass_app",
+        "_pass_interaction_to",
+        "_default_args",
+        "_annotations",
+        "spec",
+        "original_annotations",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         callback: Callable[..., Union[Any, Coroutine[Any, Any, Any]]],
@@ -32,32 +51,23 @@ class OptionalAsyncCallable:
             self._on_error_is_coro = False
         self._on_error = on_error
 
-        self._pass_error_app: bool = False
-
-        if self._on_error is not None:
-            for param, hint in inspect.getfullargspec(
-                self._on_error
-            ).annotations.items():
-                if param == "return":
-                    continue
-
-                if param == "app":
-                    self._pass_error_app = True
-                    del self.annotations[param]
-                    break
+        self._pass_error_app = on_error is not None and _wants_app(on_error)
 
         self.spec = inspect.getfullargspec(callback)
-        self.original_annotations = self.spec.annotations.copy()
+        self.original_annotations = self.spec.annotations
 
+        # The injected parameters are filtered out in a single pass, leaving
+        # the spec's own annotations untouched.
         self._pass_interaction_to: Optional[str] = None
         self._pass_app: bool = False
-        for param, hint in self.annotations.copy().items():
+        annotations = {}
+        for param, hint in self.original_annotations.items():
             if param == "return":
+                annotations[param] = hint
                 continue
 
             if param == "app":
                 self._pass_app = True
-                del self.annotations[param]
                 continue
 
             try:
@@ -67,12 +77,15 @@ class OptionalAsyncCallable:
 
             if name == "Interaction" and self._pass_interaction_to is None:
                 self._pass_interaction_to = param
-                del self.annotations[param]
+                continue
             elif name == "Interaction" and self._pass_interaction_to is not None:
                 raise TypeError(
                     f"check already has `Interaction` being passed to it via {self._pass_interaction_to!r}"
                 )
 
+            annotations[param] = hint
+        self._annotations = annotations
+
         default_args = {}
         if self.spec.defaults is not None:
             delta = len(self.spec.args) - len(self.spec.defaults)
@@ -85,10 +98,17 @@ class OptionalAsyncCallable:
             else callback
         )
 
+        # The callback never changes so pick how it's invoked once, rather than
+        # checking on every call.
+        self._invoke = (
+            self._invoke_coro if self._callback_is_coro else self._invoke_sync
+        )
+
     def _register_error_handler(
         self, func: Callable[..., Union[Any, Coroutine[Any, Any, Any]]]
     ):
         self._on_error_is_coro = asyncio.iscoroutinefunction(func)
+        self._pass_error_app = _wants_app(func)
         self._on_error = func
 
     @property
@@ -97,7 +117,7 @@ class OptionalAsyncCallable:
 
     @property
     def annotations(self) -> Dict[str, Any]:
-        return self.spec.annotations
+        return self._annotations
 
     async def __call__(self, app: SlashCommands, interaction: Interaction) -> Any:
         try:
@@ -107,9 +127,7 @@ class OptionalAsyncCallable:
                 raise e from None
             return await self._invoke_error_handler(app, interaction, e)
 
-    async def _get_kwargs(
-        self, app: SlashCommands, interaction: Interaction
-    ) -> dict:  # noqa
+    def _get_kwargs(self, app: SlashCommands, interaction: Interaction) -> dict:
         kwargs = {}
 
         if self._pass_interaction_to is not None:
@@ -120,15 +138,15 @@ class OptionalAsyncCallable:
 
         return kwargs
 
-    async def _invoke(self, app: SlashCommands, interaction: Interaction):
-        kwargs = await self._get_kwargs(app, interaction)
-
-        if self._callback_is_coro:
-            return await self._callback(**kwargs)
+    async def _invoke_coro(self, app: SlashCommands, interaction: Interaction):
+        kwargs = self._get_kwargs(app, interaction)
+        return await self._callback(**kwargs)
 
-        partial = functools.partial(self._callback, **kwargs)
+    async def _invoke_sync(self, app: SlashCommands, interaction: Interaction):
+        kwargs = self._get_kwargs(app, interaction)
+        func = functools.partial(self._callback, **kwargs) if kwargs else self._callback
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, partial)
+        return await loop.run_in_executor(app._sync_pool, func)
 
     async def _invoke_error_handler(
         self,
@@ -141,10 +159,15 @@ class OptionalAsyncCallable:
                 return await self._on_error(app, interaction, error)
             return await self._on_error(interaction, error)
 
-        partial = functools.partial(self._on_error, interaction, error)
+        loop = asyncio.get_running_loop()
+        if not self._pass_error_app:
+            return await loop.run_in_executor(
+                app._sync_pool, self._on_error, interaction, error
+            )
 
-        if self._pass_error_app:
-            partial.keywords["app"] = app
+        partial = functools.partial(self._on_error, interaction, error, app=app)
+        return await loop.run_in_executor(app._sync_pool, partial)
 
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, partial)
+
+def _wants_app(func: Callable[..., Any]) -> bool:
+    return "app" in inspect.getfullargspec(func).annotations
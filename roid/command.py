@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import typing
+import asyncio
+import orjson
 
 from enum import Enum, IntEnum, auto
 from typing import (
@@ -15,10 +17,9 @@ from typing import (
     Set,
     TYPE_CHECKING,
 )
-from pydantic import BaseModel, constr, validate_arguments
+from pydantic import BaseModel, constr
 from fastapi import HTTPException
 
-
 if TYPE_CHECKING:
     from roid.app import SlashCommands
     from roid.deferred import DeferredGroupCommand
@@ -151,12 +152,12 @@ class AutoCompleteHandler(OptionalAsyncCallable):
 
         self.target_options = {name for name in self.annotations if name != "return"}
 
-    async def _get_kwargs(
+    def _get_kwargs(
         self,
         app: SlashCommands,
         interaction: Interaction,
     ) -> dict:
-        kwargs = await super()._get_kwargs(app, interaction)
+        kwargs = super()._get_kwargs(app, interaction)
 
         if interaction.data.options is None:
             raise HTTPException(status_code=400)
@@ -252,6 +253,10 @@ class Command(OptionalAsyncCallable):
         self._autocomplete_handlers: Dict[str, AutoCompleteHandler] = {}
         self._checks_pipeline: List[CommandCheck] = []
 
+        # The serialized command context, this is reset whenever
+        # something that changes the context is added.
+        self._payload: Optional[bytes] = None
+
     def _get_details_from_spec(
         self,
         cmd_name: str,
@@ -353,14 +358,31 @@ class Command(OptionalAsyncCallable):
                 should be registered to.
         """
 
-        ctx = self.ctx
+        # The guild is given by the route so the same serialized
+        # context can be sent for every guild.
+        payload = self.payload
         if self.guild_ids is None:
-            await app._http.register_command(None, ctx)
+            await app._http.register_command(None, payload)
             return
 
-        for guild_id in self.guild_ids:
-            ctx.guild_id = guild_id
-            await app._http.register_command(guild_id, ctx)
+        await asyncio.gather(
+            *(
+                app._http.register_command(guild_id, payload)
+                for guild_id in self.guild_ids
+            )
+        )
+
+    @property
+    def payload(self) -> bytes:
+        """
+        Gets the command context serialized as JSON.
+
+        This is cached until an autocomplete handler or sub command is added.
+        """
+
+        if self._payload is None:
+            self._payload = orjson.dumps(self.ctx.dict())
+        return self._payload
 
     @property
     def ctx(self) -> CommandContext:
@@ -435,7 +457,7 @@ class Command(OptionalAsyncCallable):
         else:
             self._checks_pipeline.append(check)
 
-    async def _get_kwargs(self, app: SlashCommands, interaction: Interaction) -> dict:
+    def _get_kwargs(self, app: SlashCommands, interaction: Interaction) -> dict:
         """
         Creates the kwarg dictionary for the command to be invoked based off
         of the interaction.
@@ -445,7 +467,7 @@ class Command(OptionalAsyncCallable):
         passed directly.
         """
 
-        kwargs = await super()._get_kwargs(app, interaction)
+        kwargs = super()._get_kwargs(app, interaction)
 
         extend = {}
         cmd_type = self.type
@@ -580,6 +602,7 @@ class Command(OptionalAsyncCallable):
 
             target = for_ if for_ != AutoCompleteHandler.DEFAULT_TARGET else None
             self._autocomplete_handlers[for_] = AutoCompleteHandler(func, target=target)
+            self._payload = None
             return func
 
         if for_ not in self.original_annotations:
@@ -597,6 +620,7 @@ class Command(OptionalAsyncCallable):
 
         def wrapper(func_):
             self._autocomplete_handlers[for_] = AutoCompleteHandler(func_, target=for_)
+            self._payload = None
             return func_
 
         return wrapper
@@ -666,7 +690,11 @@ class CommandGroup(Command):
                     interaction.data.options.pop(i)
                     break
 
-        return await self._commands[sub_command](app, interaction)
+        command = self._commands.get(sub_command)
+        if command is None:
+            raise HTTPException(status_code=400, detail="No command found")
+
+        return await command(app, interaction)
 
     @property
     def ctx(self) -> CommandContext:
@@ -699,7 +727,6 @@ class CommandGroup(Command):
         ctx.options = options
         return ctx
 
-    @validate_arguments
     def command(self, name: str):
         """
         Registers a group command with the given app.
@@ -726,6 +753,7 @@ class CommandGroup(Command):
                     f"command with name {name!r} has already been defined and registered"
                 )
             self._commands[name] = cmd
+            self._payload = None
 
             return cmd
 
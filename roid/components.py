@@ -14,7 +14,7 @@ from typing import (
     TYPE_CHECKING,
     Tuple,
 )
-from pydantic import BaseModel, conint, AnyHttpUrl, constr, validate_arguments
+from pydantic import BaseModel, conint, constr, validate_arguments
 
 from roid.exceptions import InvalidComponent, AbortInvoke
 from roid.objects import PartialEmoji, ResponseFlags, ResponseType
@@ -39,7 +39,43 @@ DiscordHttpUrl = constr(
     regex="(?:https|http|discord)://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
 )
 LimitedStr = constr(strip_whitespace=True, max_length=100, min_length=1)
+CUSTOM_ID_REGEX = "[a-zA-Z0-9]+"
 EMOJI_REGEX = r"<(a)?:([a-zA-Z0-9]+):([0-9]{17,26})>"
+EmojiStr = constr(strip_whitespace=True, regex=EMOJI_REGEX)
+
+_CUSTOM_ID_PATTERN = re.compile(CUSTOM_ID_REGEX)
+_EMOJI_PATTERN = re.compile(EMOJI_REGEX)
+
+
+def validate_custom_id(custom_id: str) -> str:
+    """
+    Checks a user given component custom id, returning it stripped of whitespace.
+
+    A `ValueError` is raised if the id is empty, longer than 32 characters
+    or does not start with an alphanumeric character.
+    """
+
+    custom_id = custom_id.strip()
+    if not 0 < len(custom_id) <= 32 or _CUSTOM_ID_PATTERN.match(custom_id) is None:
+        raise ValueError(
+            f"invalid custom_id {custom_id!r}, expected 1 to 32 alphanumeric characters."
+        )
+    return custom_id
+
+
+def parse_emoji(emoji: str) -> PartialEmoji:
+    """
+    Converts a custom emoji string e.g. `<:name:id>` into a PartialEmoji.
+
+    A `ValueError` is raised if the string is not a custom emoji.
+    """
+
+    match = _EMOJI_PATTERN.match(emoji.strip())
+    if match is None:
+        raise ValueError(f"invalid custom emoji {emoji!r}, expected `<:name:id>`.")
+
+    animated, name, id_ = match.groups()
+    return PartialEmoji(id=id_, name=name, animated=bool(animated))
 
 
 class ComponentType(IntEnum):
@@ -105,7 +141,7 @@ class SelectValue:
         *,
         label: Optional[LimitedStr] = None,
         description: Optional[LimitedStr] = None,
-        emoji: Optional[constr(strip_whitespace=True, regex=EMOJI_REGEX)] = None,
+        emoji: Optional[EmojiStr] = None,
         default: bool = False,
     ):
         self.value = value
@@ -114,9 +150,7 @@ class SelectValue:
         self.default = default
 
         if emoji is not None:
-            emoji = re.findall(EMOJI_REGEX, emoji)[0]
-            animated, name, id_ = emoji
-            emoji = PartialEmoji(id=id_, name=name, animated=bool(animated))
+            emoji = parse_emoji(emoji)
 
         self.emoji = emoji
 
@@ -302,34 +336,33 @@ class Component(OptionalAsyncCallable):
 
         return resp
 
-    async def _invoke(
+    async def _invoke_coro(
         self, app: SlashCommands, interaction: Interaction
     ) -> Tuple[Response, InvokeContext]:
         kwargs, ctx = await self._get_kwargs(app, interaction)
+        return await self._callback(**kwargs), ctx
 
-        if self._callback_is_coro:
-            return await self._callback(**kwargs), ctx
-
-        partial = functools.partial(self._callback, **kwargs)
+    async def _invoke_sync(
+        self, app: SlashCommands, interaction: Interaction
+    ) -> Tuple[Response, InvokeContext]:
+        kwargs, ctx = await self._get_kwargs(app, interaction)
+        func = functools.partial(self._callback, **kwargs) if kwargs else self._callback
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, partial), ctx
+        return await loop.run_in_executor(app._sync_pool, func), ctx
 
     async def _get_kwargs(
         self,
         app: SlashCommands,
         interaction: Interaction,
     ) -> Tuple[dict, InvokeContext]:
-        _, *reference_id = interaction.data.custom_id.split(":", maxsplit=1)
-
-        if len(reference_id) == 0:
-            reference_id = None
-        else:
-            reference_id = reference_id[0]
+        custom_id = interaction.data.custom_id
+        split_at = custom_id.find(":")
+        reference_id = custom_id[split_at + 1 :] if split_at != -1 else None
 
         state = self.app.state[COMMAND_STATE_TARGET]
 
         ctx = await state.get(reference_id)
-        kwargs = await super()._get_kwargs(app, interaction)
+        kwargs = super()._get_kwargs(app, interaction)
         if self._pass_context_to is not None and ctx is not None:
             kwargs[self._pass_context_to] = InvokeContext(reference_id, state, **ctx)
 
@@ -21,10 +21,13 @@ def extract_user(interaction: Interaction, value: str) -> Member:
 
 
 def extract_mentionable(interaction: Interaction, value: str) -> Union[Role, Member]:
-    try:
-        return interaction.data.resolved.roles[int(value)]
-    except KeyError:
-        return extract_user(interaction, value)
+    roles = interaction.data.resolved.roles
+    if roles:
+        role = roles.get(int(value))
+        if role is not None:
+            return role
+
+    return extract_user(interaction, value)
 
 
 def _echo(_: Interaction, v: Any) -> Any:
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from functools import reduce
-from operator import or_
-from typing import Optional, Union, List, Callable
+from typing import Optional, List, Callable
 
 from pydantic import validate_arguments
 
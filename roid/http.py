@@ -6,12 +6,7 @@ import logging
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
 
-from pydantic import BaseModel
-
-try:
-    import orjson as json
-except ImportError:
-    import json
+import orjson
 
 if TYPE_CHECKING:
     from roid.command import Command
@@ -25,22 +20,6 @@ DISCORD_CDN_DOMAIN = "cdn.discord.com"
 _log = logging.getLogger("roid-http")
 
 
-class MaybeUnlock:
-    def __init__(self, lock: asyncio.Lock) -> None:
-        self.lock = lock
-        self._unlock: bool = True
-
-    def __enter__(self) -> "MaybeUnlock":
-        return self
-
-    def defer(self) -> None:
-        self._unlock = False
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        if self._unlock:
-            self.lock.release()
-
-
 def _parse_rate_limit_header(response: httpx.Response) -> float:
     reset_after = response.headers.get("X-Ratelimit-Reset-After")
     if not reset_after:
@@ -58,10 +37,8 @@ class HttpHandler:
         self,
         application_id: int,
         token: str,
+        max_concurrency: int = 5,
     ):
-        self.lock = asyncio.Lock()
-        self.client = httpx.AsyncClient(http2=True)
-
         self.user_agent = (
             f"DiscordBot (https://github.com/chillfish8/roid {__version__})"
         )
@@ -69,12 +46,56 @@ class HttpHandler:
         self.application_id = application_id
         self.__token = token
         self._primary_route = f"https://{DISCORD_DOMAIN}/api/{self.API_VERSION}"
-        self._application_route = f"{self._primary_route}/applications/{application_id}"
+        self._application_route = f"/applications/{application_id}"
+
+        # Requests run concurrently up to `max_concurrency`, when a rate limit
+        # bucket is emptied the gate is closed until it resets.
+        self._concurrency = asyncio.Semaphore(max_concurrency)
+        self._gate = asyncio.Event()
+        self._gate.set()
+        self._gate_timer: Optional[asyncio.TimerHandle] = None
+
+        # The client lives for the lifetime of the app so the connection and
+        # default headers are re-used across every request rather than rebuilt.
+        self.client = httpx.AsyncClient(
+            http2=True,
+            base_url=self._primary_route,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            headers={
+                "Authorization": f"Bot {self.__token}",
+                "User-Agent": self.user_agent,
+            },
+        )
 
     async def shutdown(self):
+        if self._gate_timer is not None:
+            self._gate_timer.cancel()
         await self.client.aclose()
 
-    async def register_command(self, guild_id: Optional[int], ctx: BaseModel):
+    def _close_gate(self, delay: float):
+        """Stops any new requests being sent for the next `delay` seconds."""
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + delay
+
+        # A shorter limit must not reopen the gate before a longer one expires.
+        if self._gate_timer is not None:
+            if self._gate_timer.when() >= deadline:
+                return
+            self._gate_timer.cancel()
+
+        self._gate.clear()
+        self._gate_timer = loop.call_at(deadline, self._open_gate)
+
+    def _open_gate(self):
+        self._gate_timer = None
+        self._gate.set()
+
+    async def register_command(self, guild_id: Optional[int], payload: bytes):
         if guild_id is None:
             url = "/commands"
         else:
@@ -83,19 +104,47 @@ class HttpHandler:
         await self.request(
             "POST",
             url,
-            json=ctx.dict(),
+            content=payload,
+            headers={"Content-Type": "application/json"},
         )
 
     async def register_commands(self, commands: List[Command]):
         await self.request(
             "PUT",
             "/commands",
-            json=[c.ctx.dict() for c in commands],
+            content=b"[" + b",".join(c.payload for c in commands) + b"]",
+            headers={"Content-Type": "application/json"},
+        )
+
+    async def register_guild_commands(self, guild_id: int, commands: List[Command]):
+        await self.request(
+            "PUT",
+            f"/guilds/{guild_id}/commands",
+            content=b"[" + b",".join(c.payload for c in commands) + b"]",
+            headers={"Content-Type": "application/json"},
         )
 
     async def get_global_commands(self) -> List[dict]:
         return await self.request("GET", "/commands")
 
+    async def edit_interaction_message(self, interaction_token: str, data: dict):
+        return await self.request(
+            "PATCH",
+            f"/webhooks/{self.application_id}/{interaction_token}/messages/@original",
+            primary_route_only=True,
+            content=orjson.dumps(data),
+            headers={"Content-Type": "application/json"},
+        )
+
+    async def create_followup_message(self, interaction_token: str, data: dict):
+        return await self.request(
+            "POST",
+            f"/webhooks/{self.application_id}/{interaction_token}",
+            primary_route_only=True,
+            content=orjson.dumps(data),
+            headers={"Content-Type": "application/json"},
+        )
+
     async def delete_interaction_message(self, interaction_token: str):
         return await self.request(
             "DELETE",
@@ -104,32 +153,23 @@ class HttpHandler:
         )
 
     async def request(self, method: str, section: str, headers: dict = None, **extra):
-        set_headers = {
-            "Authorization": f"Bot {self.__token}",
-            "User-Agent": self.user_agent,
-        }
-
-        if headers is not None:
-            set_headers = {**headers, **set_headers}
-
         if extra.pop("primary_route_only", False):
-            url = f"{self._primary_route}{section}"
+            url = section
         else:
             url = f"{self._application_route}{section}"
 
-        await self.lock.acquire()
-        with MaybeUnlock(self.lock) as lock:
+        async with self._concurrency:
             r = None
             for tries in range(5):
+                await self._gate.wait()
+
                 try:
-                    r = await self.client.request(
-                        method, url, headers=set_headers, **extra
-                    )
+                    r = await self.client.request(method, url, headers=headers, **extra)
 
                     data = await r.aread()
                     try:
-                        data = json.loads(data)
-                    except json.JSONDecodeError:
+                        data = orjson.loads(data)
+                    except orjson.JSONDecodeError:
                         data = data.decode("utf-8")
 
                     if r.status_code >= 500:
@@ -140,13 +180,14 @@ class HttpHandler:
                         # we've depleted our current bucket
                         delta = _parse_rate_limit_header(r)
                         _log.debug(
-                            f"we've emptied our rate limit bucket on endpoint: {url}, retry: {delta:.2}"
+                            "we've emptied our rate limit bucket on endpoint: %s, retry: %.2f",
+                            url,
+                            delta,
                         )
-                        lock.defer()
-                        asyncio.get_running_loop().call_later(delta, self.lock.release)
+                        self._close_gate(delta)
 
                     if 300 > r.status_code >= 200:
-                        _log.debug(f"{method} {url} successful response: {data}")
+                        _log.debug("%s %s successful response: %s", method, url, data)
                         return data
 
                     if r.status_code == 429:
@@ -165,6 +206,7 @@ class HttpHandler:
                                 "Global rate limit has been hit. Retrying in %.2f seconds.",
                                 retry_after,
                             )
+                            self._close_gate(retry_after)
 
                         await asyncio.sleep(retry_after)
                         _log.debug(
@@ -179,14 +221,16 @@ class HttpHandler:
                         raise NotFound(r, data)
                     elif r.status_code == 400:
                         errors = data["errors"]
-
-                        sections = []
-                        for location, detail in errors.items():
-                            message_details = ", ".join(
-                                [item["message"] for item in detail["_errors"]]
-                            )
-                            sections.append(f"Error @ {location}: {message_details}")
-                        raise HTTPException(r, data="\n".join(sections))
+                        raise HTTPException(
+                            r,
+                            data="\n".join(
+                                f"Error @ {location}: "
+                                + ", ".join(
+                                    item["message"] for item in detail["_errors"]
+                                )
+                                for location, detail in errors.items()
+                            ),
+                        )
                     else:
                         raise HTTPException(r, data)
 
@@ -194,7 +238,8 @@ class HttpHandler:
                 except httpx.TransportError as e:
                     if tries < 4:
                         _log.warning(
-                            f"failed preparing to retry connection failure due to error {e!r}"
+                            "failed preparing to retry connection failure due to error %r",
+                            e,
                         )
                         await asyncio.sleep(1 + tries * 2)
                         continue
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import uuid
+import secrets
 from typing import List, Optional, Dict, Any, Union, TYPE_CHECKING
 
-from pydantic import BaseModel, constr, validate_arguments, validator
+from pydantic import BaseModel, constr, validator
 
 from roid.state import COMMAND_STATE_TARGET
 
@@ -81,7 +81,6 @@ class ResponsePayload(BaseModel):
 
 
 class Response:
-    @validate_arguments(config={"arbitrary_types_allowed": True})
     def __init__(
         self,
         content: str = None,
@@ -151,7 +150,9 @@ class Response:
             A `ResponsePayload` object.
         """
 
-        embeds = embeds or []
+        # The payload model below validates all of the given fields so we only
+        # copy the embeds to avoid mutating the caller's list.
+        embeds = list(embeds) if embeds else []
 
         if embed is not None:
             embeds.append(embed)
@@ -186,13 +187,13 @@ class Response:
         if self.delete_parent and self.is_empty:
             self._payload.content = "Deleted parent."
             self._payload.flags = ResponseFlags.EPHEMERAL
-            return ResponsePayload(type=ResponseType.DEFERRED_UPDATE_MESSAGE)
+            return ResponsePayload.construct(type=ResponseType.DEFERRED_UPDATE_MESSAGE)
 
         if self.is_empty:
-            return ResponsePayload(type=ResponseType.DEFERRED_UPDATE_MESSAGE)
+            return ResponsePayload.construct(type=ResponseType.DEFERRED_UPDATE_MESSAGE)
 
         if self._payload.components is None:
-            return ResponsePayload(
+            return ResponsePayload.construct(
                 type=ResponseType.CHANNEL_MESSAGE_WITH_SOURCE, data=self._payload
             )
 
@@ -233,7 +234,9 @@ class Response:
         resp = self._payload.dict()
         del resp["components"]
         data = ResponseData(**resp, components=action_rows)
-        return ResponsePayload(type=self._response_type or default_type, data=data)
+        return ResponsePayload.construct(
+            type=self._response_type or default_type, data=data
+        )
 
     async def process_block(
         self,
@@ -259,7 +262,7 @@ class Response:
             # If its got a url we wont get invoked on a click
             # so we can ignore setting a reference id.
             if data.url is None:
-                reference_id = str(uuid.uuid4())
+                reference_id = secrets.token_urlsafe(12)
                 data.custom_id = f"{data.custom_id}:{reference_id}"
                 flags = self._payload.flags or 0
                 await state.set(
@@ -303,7 +306,7 @@ class Response:
             # If its got a url we wont get invoked on a click
             # so we can ignore setting a reference id.
             if data.url is None:
-                reference_id = str(uuid.uuid4())
+                reference_id = secrets.token_urlsafe(12)
                 data.custom_id = f"{data.custom_id}:{reference_id}"
                 flags = self._payload.flags or 0
                 await state.set(
@@ -0,0 +1,37 @@
+import sys
+import asyncio
+import logging
+
+_log = logging.getLogger("roid-runtime")
+
+
+def install_uvloop() -> bool:
+    """
+    Sets uvloop as the asyncio event loop policy if it is installed.
+
+    This only has an effect if it's called before the event loop is created,
+    if a loop is already running it is left untouched.
+    Note that uvicorn will already pick uvloop if it's installed.
+
+    Returns:
+        True if the uvloop policy was installed otherwise False.
+    """
+
+    if sys.platform == "win32":
+        return False
+
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        _log.debug("event loop is already running, not installing uvloop")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
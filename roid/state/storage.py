@@ -142,6 +142,7 @@ class _SqliteRunner:
 
     def shutdown(self):
         self._running = False
+        self._queue.put_nowait(None)
         self._thread.join()
 
     def _runner(self, db_name: str):
@@ -158,7 +159,9 @@ class _SqliteRunner:
         )
 
         while self._running:
-            event: _SqliteOp = self._queue.get()
+            event: Optional[_SqliteOp] = self._queue.get()
+            if event is None:
+                break
 
             if event.action == "SET":
                 self._set(db, **event.data)
@@ -172,6 +175,8 @@ class _SqliteRunner:
             else:
                 raise Exception(f"Unknown action {event.action!r}")
 
+        db.close()
+
     @staticmethod
     def _delete(db: sqlite3.Connection, key: str):
         cur = db.cursor()
@@ -0,0 +1,204 @@
+import math
+import time
+import asyncio
+import hashlib
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import List, Tuple
+
+from nacl.bindings import crypto_sign_open, crypto_sign_BYTES
+from nacl.exceptions import BadSignatureError
+
+
+class SignatureVerifier:
+    """
+    Verifies the Ed25519 signatures Discord attaches to every interaction.
+    """
+
+    def __init__(self, public_key: str, cache_size: int = 0, cache_ttl: float = 60):
+        """
+        Verifies the Ed25519 signatures Discord attaches to every interaction.
+
+        Args:
+            public_key:
+                The hex encoded application public key.
+
+            cache_size:
+                The number of successfully verified messages to remember so
+                duplicate deliveries skip verification, 0 disables the cache.
+
+                Only valid signatures are cached, a replayed request would pass
+                verification anyway so this does not weaken the check.
+
+            cache_ttl:
+                The number of seconds a verified message is remembered for.
+        """
+
+        # libsodium is called directly with the raw key, VerifyKey.verify
+        # only adds argument checks on top of the same binding.
+        self._key = bytes.fromhex(public_key)
+
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl
+        self._cache: "OrderedDict[bytes, float]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def verify(self, signature: bytes, message: bytes) -> bool:
+        """
+        Checks the given signature against the message.
+
+        Args:
+            signature:
+                The raw 64 byte signature.
+
+            message:
+                The signed message, this is the timestamp followed by the body.
+
+        Returns:
+            True if the signature is valid otherwise False.
+        """
+
+        if not self._cache_size:
+            return self._verify(signature, message)
+
+        key = signature + hashlib.blake2b(message, digest_size=16).digest()
+        now = time.monotonic()
+        with self._cache_lock:
+            expires = self._cache.get(key)
+            if expires is not None and expires > now:
+                return True
+
+        if not self._verify(signature, message):
+            return False
+
+        with self._cache_lock:
+            self._cache[key] = now + self._cache_ttl
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        return True
+
+    def _verify(self, signature: bytes, message: bytes) -> bool:
+        if len(signature) != crypto_sign_BYTES:
+            return False
+
+        try:
+            crypto_sign_open(signature + message, self._key)
+        except (BadSignatureError, ValueError):
+            return False
+        return True
+
+
+class BatchVerifier:
+    """
+    Verifies signatures on a thread pool, batching together any verifications
+    requested within the same event loop iteration.
+
+    Under bursts of interactions each batch is split evenly across the pool's
+    workers rather than handing over one job per request, the signatures
+    themselves are still checked individually.
+    """
+
+    def __init__(
+        self,
+        verifier: SignatureVerifier,
+        executor: Executor,
+        workers: int,
+        max_batch_size: int = 64,
+    ):
+        """
+        Verifies signatures on a thread pool, batching together any verifications
+        requested within the same event loop iteration.
+
+        Args:
+            verifier:
+                The verifier used to check each signature.
+
+            executor:
+                The executor the batches are ran on.
+
+            workers:
+                The number of workers the executor has, each batch is split
+                into at most this many jobs.
+
+            max_batch_size:
+                The maximum number of signatures checked in a single job.
+        """
+
+        self._verifier = verifier
+        self._executor = executor
+        self._workers = workers
+        self._max_batch_size = max_batch_size
+        self._pending: List[Tuple[bytes, bytes, asyncio.Future]] = []
+
+    async def verify(self, signature: bytes, message: bytes) -> bool:
+        """
+        Checks the given signature against the message.
+
+        Args:
+            signature:
+                The raw 64 byte signature.
+
+            message:
+                The signed message, this is the timestamp followed by the body.
+
+        Returns:
+            True if the signature is valid otherwise False.
+        """
+
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+
+        if not self._pending:
+            loop.call_soon(self._flush, loop)
+        self._pending.append((signature, message, fut))
+
+        return await fut
+
+    def _flush(self, loop: asyncio.AbstractEventLoop):
+        pending, self._pending = self._pending, []
+
+        # Spread the batch over every worker so a burst isn't checked on one thread.
+        size = min(self._max_batch_size, math.ceil(len(pending) / self._workers))
+        for i in range(0, len(pending), size):
+            batch = pending[i : i + size]
+            try:
+                job = loop.run_in_executor(self._executor, self._verify_batch, batch)
+            except Exception as e:
+                for _, _, fut in pending[i:]:
+                    if not fut.done():
+                        fut.set_exception(e)
+                return
+
+            job.add_done_callback(functools.partial(_resolve_batch, batch))
+
+    def _verify_batch(
+        self, batch: List[Tuple[bytes, bytes, asyncio.Future]]
+    ) -> List[bool]:
+        verify = self._verifier.verify
+        return [verify(signature, message) for signature, message, _ in batch]
+
+
+def _resolve_batch(
+    batch: List[Tuple[bytes, bytes, asyncio.Future]],
+    job: asyncio.Future,
+):
+    if job.cancelled():
+        for _, _, fut in batch:
+            fut.cancel()
+        return
+
+    exc = job.exception()
+    results = job.result() if exc is None else [None] * len(batch)
+
+    for (_, _, fut), result in zip(batch, results):
+        if fut.done():
+            continue
+
+        if exc is not None:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(result)
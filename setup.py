@@ -16,6 +16,7 @@ with open("README.md", encoding="UTF-8") as f:
 extras_require = {
     "speedups": [
         "orjson>=3.5.4",
+        "uvloop; sys_platform != 'win32'",
     ]
 }
 